@@ -0,0 +1,67 @@
+from types import MappingProxyType
+
+# Ticker universes shown in the app, keyed by risk level or fund category.
+# Built once at import time and read-only, so Streamlit reruns share them safely.
+INDIAN_STOCKS = MappingProxyType({
+    "Low Risk": ("HDFCBANK.NS", "TCS.NS", "HINDUNILVR.NS", "INFY.NS", "RELIANCE.NS"),
+    "Medium Risk": ("ICICIBANK.NS", "AXISBANK.NS", "SBIN.NS", "LT.NS", "MARUTI.NS"),
+    "High Risk": ("TATAMOTORS.NS", "ZOMATO.NS", "PAYTM.NS", "YESBANK.NS", "IDEA.NS"),
+})
+
+US_STOCKS = MappingProxyType({
+    "Low Risk": ("MSFT", "AAPL", "JNJ", "PG", "KO"),
+    "Medium Risk": ("GOOGL", "AMZN", "META", "NVDA", "V"),
+    "High Risk": ("TSLA", "PLTR", "RIVN", "COIN", "GME"),
+})
+
+CRYPTO_TICKERS = ("BTC-USD", "ETH-USD", "BNB-USD", "XRP-USD", "SOL-USD")
+
+MUTUAL_FUNDS = MappingProxyType({
+    "Large Cap": ("HDFC Top 100", "Axis Bluechip", "Mirae Asset Large Cap"),
+    "Mid Cap": ("Kotak Emerging Equity", "HDFC Mid-Cap Opportunities", "DSP Midcap"),
+    "Small Cap": ("Nippon Small Cap", "SBI Small Cap", "Axis Small Cap"),
+})
+
+# Static market news shown on the results page and summarized for the LLM prompt
+NEWS_DATA = (
+    MappingProxyType({
+        'title': 'Global Markets Show Strong Recovery',
+        'description': 'Major global indices demonstrate resilience as markets recover from recent volatility. Tech and financial sectors lead the gains.',
+        'source': 'Market Analysis Daily',
+        'published': 'Today',
+        'url': 'https://example.com/markets',
+    }),
+    MappingProxyType({
+        'title': 'Tech Stocks Continue Upward Trend',
+        'description': 'Technology sector maintains momentum as AI and cloud computing companies report strong quarterly earnings.',
+        'source': 'Tech Finance Weekly',
+        'published': 'Today',
+        'url': 'https://example.com/tech',
+    }),
+    MappingProxyType({
+        'title': 'Emerging Markets Present New Opportunities',
+        'description': 'Analysts identify promising investment opportunities in emerging markets as economic indicators show positive trends.',
+        'source': 'Global Investment Review',
+        'published': 'Today',
+        'url': 'https://example.com/emerging',
+    }),
+    MappingProxyType({
+        'title': 'Sustainable Investments Gain Traction',
+        'description': 'ESG-focused investments continue to attract capital as investors prioritize sustainable and responsible investing.',
+        'source': 'Sustainable Finance Today',
+        'published': 'Today',
+        'url': 'https://example.com/esg',
+    }),
+)
+
+# Investment projection scenarios: conservative, moderate and aggressive annual returns
+SCENARIO_NAMES = ('Conservative', 'Moderate', 'Aggressive')
+SCENARIO_RATES = (0.08, 0.12, 0.15)
+SCENARIO_COLORS = MappingProxyType({
+    'Conservative': '#2E86C1',  # Blue
+    'Moderate': '#28B463',      # Green
+    'Aggressive': '#E74C3C',    # Red
+})
+
+# Horizons offered by the projection calculators, in years
+PROJECTION_YEARS = (1, 3, 5, 10, 15, 20)
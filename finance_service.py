@@ -2,35 +2,101 @@ import yfinance as yf
 import pandas as pd
 import numpy as np
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import logging
 import threading
-from datetime import datetime
+import atexit
+from collections import OrderedDict
+from datetime import date
 import time
-from typing import Dict, Optional, List, Union, Any
+from typing import Dict, Optional, List, Tuple, Union, Any
 from forex_python.converter import CurrencyRates
-import datetime
+from .metrics import annualized_log_return, annualized_log_returns, ohlcv_metrics
+
+logger = logging.getLogger(__name__)
 
 # Constants for market data
-INDIAN_TOP_STOCKS = [
+INDIAN_TOP_STOCKS = (
     'RELIANCE.NS', 'TCS.NS', 'HDFCBANK.NS', 'INFY.NS', 'ICICIBANK.NS',
     'HINDUNILVR.NS', 'ITC.NS', 'SBIN.NS', 'BHARTIARTL.NS', 'BAJFINANCE.NS'
-]
+)
 
-US_TOP_STOCKS = [
+US_TOP_STOCKS = (
     'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 
     'META', 'BRK-B', 'JPM', 'V', 'TSLA'
-]
+)
 
 cr = CurrencyRates()
 
+# Shared worker pool for the I/O-bound per-ticker lookups, reused across calls
+_EXECUTOR = ThreadPoolExecutor(max_workers=32, thread_name_prefix='yf')
+atexit.register(_EXECUTOR.shutdown)
+
+# FX rates move slowly relative to a UI session, so cache them per process
+_FX_TTL = 6 * 60 * 60  # 6 hours
+_FX_CACHE: Dict[str, tuple] = {}  # currency -> (fetched_at, rate)
+_FX_LOCK = threading.Lock()
+
+def get_inr_rate(currency: str) -> float:
+    """Get the conversion rate from `currency` to INR, cached for a few hours"""
+    if currency == 'INR':
+        return 1.0
+    now = time.time()
+    entry = _FX_CACHE.get(currency)
+    if entry and now - entry[0] < _FX_TTL:
+        return entry[1]
+    with _FX_LOCK:
+        # Another thread may have refreshed the rate while we waited
+        entry = _FX_CACHE.get(currency)
+        if entry and now - entry[0] < _FX_TTL:
+            return entry[1]
+        rate = cr.get_rate(currency, 'INR')
+        _FX_CACHE[currency] = (time.time(), rate)
+        return rate
+
+def _prewarm_fx_cache(currencies=('USD', 'EUR', 'GBP', 'JPY')) -> None:
+    """Populate the FX cache for the common currencies"""
+    for currency in currencies:
+        try:
+            get_inr_rate(currency)
+        except Exception as e:
+            logger.warning("Error prefetching %s rate: %s", currency, e)
+
+threading.Thread(target=_prewarm_fx_cache, name='fx-prewarm', daemon=True).start()
+
+# Ticker metadata rarely changes within a session, so reuse it for a while
+_INFO_TTL = 15 * 60  # 15 minutes
+_INFO_CACHE: Dict[str, tuple] = {}  # ticker -> (fetched_at, info)
+
+def _get_info(ticker: str, ttl: float = _INFO_TTL) -> Dict:
+    """Returns yfinance's info dict for `ticker`, cached for `ttl` seconds"""
+    now = time.time()
+    entry = _INFO_CACHE.get(ticker)
+    if entry and now - entry[0] < ttl:
+        return entry[1]
+    info = yf.Ticker(ticker).info
+    _INFO_CACHE[ticker] = (now, info)
+    return info
+
+# A ticker's trading currency never changes, so it is cached without expiry
+_CURRENCY_CACHE: Dict[str, str] = {}
+
+def _get_currency(ticker: str) -> str:
+    """Returns the trading currency of `ticker` using the lightweight fast_info endpoint"""
+    currency = _CURRENCY_CACHE.get(ticker)
+    if currency is None:
+        currency = yf.Ticker(ticker).fast_info.get('currency') or 'USD'
+        _CURRENCY_CACHE[ticker] = currency
+    return currency
+
 def convert_to_inr(amount: float, from_currency: str = 'USD') -> float:
     """Convert any currency to INR"""
     try:
         if from_currency == 'INR':
             return amount
-        rate = cr.get_rate(from_currency, 'INR')
+        rate = get_inr_rate(from_currency)
         return amount * rate
     except Exception as e:
-        print(f"Error converting currency: {str(e)}")
+        logger.warning("Error converting currency: %s", e)
         return amount  # Return original amount if conversion fails
 
 def calculate_expected_return(data: pd.DataFrame) -> float:
@@ -47,31 +113,116 @@ def calculate_expected_return(data: pd.DataFrame) -> float:
         return 0.0
         
     try:
-        # Calculate log returns
-        prices = data['Close'].dropna()
-        log_returns = np.log(prices / prices.shift(1)).dropna()
-        
-        if len(log_returns) < 30:  # Need enough data points
+        prices = data['Close'].to_numpy(dtype=np.float64)
+        prices = prices[~np.isnan(prices)]
+        if prices.size == 0:
             return 0.0
-            
-        # Annualize the mean return (252 trading days)
-        mu_daily = log_returns.mean()
-        annual_return = (np.exp(mu_daily * 252) - 1) * 100
-        
-        # Ensure return is within reasonable bounds
-        return max(min(annual_return, 100.0), -100.0)
+
+        # Annualized mean log return, bounded to a reasonable range
+        return annualized_log_return(prices[0], prices[-1], prices.size)
         
     except Exception as e:
-        print(f"Error calculating return: {str(e)}")
+        logger.warning("Error calculating return: %s", e)
         return 0.0
 
-def get_top_stocks(market: str = 'INDIA') -> List[str]:
-    """Get list of top stocks for the specified market"""
+def calculate_expected_returns(closes: pd.DataFrame) -> pd.Series:
+    """
+    Calculates the expected annual return for many tickers at once.
+
+    Args:
+        closes: DataFrame of closing prices with one column per ticker; NaNs are
+            ignored, so columns may cover different date ranges
+
+    Returns:
+        Series of annualized expected returns (percent) indexed by ticker
+    """
+    if closes is None or closes.empty:
+        return pd.Series(dtype=np.float64)
+
+    # First/last valid close and the number of closes per column, in three reductions
+    first = closes.bfill().iloc[0].to_numpy(dtype=np.float64)
+    last = closes.ffill().iloc[-1].to_numpy(dtype=np.float64)
+    counts = closes.count().to_numpy()
+    returns = annualized_log_returns(first, last, counts)
+    return pd.Series(np.nan_to_num(returns), index=closes.columns, dtype=np.float64)
+
+
+def get_top_stocks(market: str = 'INDIA') -> Tuple[str, ...]:
+    """Get the top stocks for the specified market"""
     return INDIAN_TOP_STOCKS if market.upper() == 'INDIA' else US_TOP_STOCKS
 
+_REQUIRED_COLUMNS = frozenset({'Open', 'High', 'Low', 'Close', 'Volume'})
+
+# Yahoo serves up to ~20 symbols per history request
+_DOWNLOAD_BATCH_SIZE = 20
+
+def _download_batch(batch: List[str], period: str) -> Dict[str, pd.DataFrame]:
+    """
+    Downloads price history for up to `_DOWNLOAD_BATCH_SIZE` tickers in one Yahoo request.
+
+    Returns:
+        Dict mapping each ticker that returned data to its OHLCV DataFrame; raises if the
+        download itself fails
+    """
+    data = yf.download(batch, period=period, group_by='ticker',
+                       threads=True, progress=False, auto_adjust=True)
+    if data is None or data.empty:
+        return {}
+
+    frames = {}
+    for ticker in batch:
+        if isinstance(data.columns, pd.MultiIndex):
+            if ticker not in data.columns.get_level_values(0):
+                continue
+            hist = data[ticker]
+        else:
+            hist = data  # Older yfinance returns flat columns for a single ticker
+        # The batch shares one date index, so drop days this ticker didn't trade
+        frames[ticker] = hist.dropna(how='all')
+    return frames
+
+def _download_history(tickers: List[str], period: str) -> Dict[str, pd.DataFrame]:
+    """
+    Downloads price history for many tickers using batched Yahoo requests.
+
+    Returns:
+        Dict mapping each ticker that returned data to its OHLCV DataFrame
+    """
+    frames = {}
+    for i in range(0, len(tickers), _DOWNLOAD_BATCH_SIZE):
+        batch = tickers[i:i + _DOWNLOAD_BATCH_SIZE]
+        try:
+            frames.update(_download_batch(batch, period))
+        except Exception as e:
+            logger.warning("Error downloading %s: %s", ', '.join(batch), e)
+    return frames
+
+# Processed per-ticker results keyed on (ticker, period, trading day),
+# so repeat requests within a day skip the network entirely
+_DATA_CACHE_SIZE = 512
+_DATA_CACHE: "OrderedDict[tuple, Dict]" = OrderedDict()
+_DATA_LOCK = threading.Lock()  # The cache is shared by every Streamlit session
+
+def _cache_lookup(key: tuple) -> Optional[Dict]:
+    """Returns a shallow copy of a cached ticker result, marking it recently used"""
+    with _DATA_LOCK:
+        data = _DATA_CACHE.get(key)
+        if data is None:
+            return None
+        _DATA_CACHE.move_to_end(key)
+    return dict(data)
+
+def _cache_store(key: tuple, data: Dict) -> None:
+    """Stores a ticker result, evicting the least recently used entry when full"""
+    with _DATA_LOCK:
+        _DATA_CACHE[key] = data
+        _DATA_CACHE.move_to_end(key)
+        while len(_DATA_CACHE) > _DATA_CACHE_SIZE:
+            _DATA_CACHE.popitem(last=False)
+
 def get_financial_data(tickers: Union[str, List[str]], period: str = "1y", market: str = 'INDIA') -> Dict:
     """
-    Fetches historical market data for one or more tickers using parallel requests.
+    Fetches historical market data for one or more tickers using batched requests.
     
     Args:
         tickers: Single ticker string or list of stock/crypto tickers
@@ -79,7 +230,9 @@ def get_financial_data(tickers: Union[str, List[str]], period: str = "1y", marke
         market: Market to fetch data from ('INDIA' or 'US')
 
     Returns:
-        Dict with ticker data including current price, changes, and historical data in INR
+        Dict with ticker data including current price, changes, and historical data in INR.
+        Results are cached per ticker for the current day; the historical DataFrames are
+        shared with the cache and should not be modified in place.
     """
     # Convert single ticker to list
     if isinstance(tickers, str):
@@ -88,47 +241,44 @@ def get_financial_data(tickers: Union[str, List[str]], period: str = "1y", marke
     if not tickers:
         return {}
     
-    def fetch_single_ticker(ticker: str) -> Optional[Dict]:
-        """Fetches data for a single ticker with robust error handling"""
+    def fetch_single_ticker(ticker: str, hist: Optional[pd.DataFrame]) -> Optional[Dict]:
+        """Builds the data for a single ticker from its history with robust error handling"""
         try:
-            print(f"Fetching data for {ticker}...")
-            stock = yf.Ticker(ticker)
-            info = stock.info
-            hist = stock.history(period=period)
-            
-            if hist.empty:
-                print(f"No data found for {ticker}")
+            logger.debug("Processing data for %s...", ticker)
+            if hist is None or hist.empty:
+                logger.debug("No data found for %s", ticker)
                 return None
                 
             # Ensure we have the required columns
-            required_cols = ['Open', 'High', 'Low', 'Close', 'Volume']
-            if not all(col in hist.columns for col in required_cols):
-                print(f"Missing required columns for {ticker}")
+            if not _REQUIRED_COLUMNS.issubset(hist.columns):
+                logger.debug("Missing required columns for %s", ticker)
                 return None
+
+            # Metadata lookups were started alongside the history download
+            info = info_futures[ticker].result()
                 
             # Determine currency and convert if needed
-            currency = info.get('currency', 'USD') if '.NS' not in ticker else 'INR'
+            if '.NS' in ticker:
+                currency = 'INR'
+            else:
+                currency = info.get('currency') or _get_currency(ticker)
             
             # Convert price data to INR if necessary
             if currency != 'INR':
-                conversion_rate = cr.get_rate(currency, 'INR')
-                for col in ['Open', 'High', 'Low', 'Close']:
-                    hist[col] = hist[col] * conversion_rate
+                conversion_rate = get_inr_rate(currency)
+                price_cols = ['Open', 'High', 'Low', 'Close']
+                hist.loc[:, price_cols] = hist[price_cols].to_numpy() * conversion_rate
                     
-            current = hist['Close'][-1]
-            start = hist['Close'][0]
+            # Calculate all metrics in a single pass over the raw arrays
+            high_52w, low_52w, avg_vol, start, current, n_closes = ohlcv_metrics(
+                *(hist[col].to_numpy(dtype=np.float64) for col in ('High', 'Low', 'Close', 'Volume'))
+            )
             change = ((current - start) / start) * 100
-            
-            # Calculate additional metrics
-            high_52w = hist['High'].max()
-            low_52w = hist['Low'].min()
-            avg_vol = hist['Volume'].mean()
-            exp_return = calculate_expected_return(hist)
+            exp_return = annualized_log_return(start, current, n_closes)
             
             # For visualization data, make sure all NaN values are handled
-            hist_clean = hist.copy()
-            hist_clean.fillna(method='ffill', inplace=True)  # Forward fill
-            hist_clean.fillna(method='bfill', inplace=True)  # Back fill any remaining
+            # (forward fill, then back fill any leading gaps; skipped when nothing is missing)
+            hist_clean = hist.ffill().bfill() if hist.isna().any().any() else hist
             
             return {
                 'ticker': ticker,
@@ -145,27 +295,103 @@ def get_financial_data(tickers: Union[str, List[str]], period: str = "1y", marke
                 'industry': info.get('industry', 'N/A')
             }
         except Exception as e:
-            print(f"Error fetching {ticker}: {str(e)}")
+            logger.warning("Error fetching %s: %s", ticker, e)
             return None
     
-    # Execute parallel requests
+    # Serve what we can from today's cache
+    today = date.today().isoformat()
     results = {}
-    with ThreadPoolExecutor(max_workers=min(len(tickers), 5)) as executor:
-        future_to_ticker = {
-            executor.submit(fetch_single_ticker, ticker): ticker 
-            for ticker in tickers
-        }
-        
-        for future in as_completed(future_to_ticker):
-            ticker = future_to_ticker[future]
-            try:
-                data = future.result()
-                if data:
-                    results[ticker] = data
-            except Exception as e:
-                print(f"Error processing {ticker}: {str(e)}")
+    for ticker in tickers:
+        data = _cache_lookup((ticker, period, today))
+        if data:
+            results[ticker] = data
+    missing = [ticker for ticker in dict.fromkeys(tickers) if ticker not in results]
+    if not missing:
+        return results
+
+    # Start the metadata lookups first so they overlap with the batched history download
+    info_futures = {ticker: _EXECUTOR.submit(_get_info, ticker) for ticker in missing}
+
+    # Fetch the remaining price history in batches, then build each ticker's data in parallel
+    history = _download_history(missing, period)
+    future_to_ticker = {
+        _EXECUTOR.submit(fetch_single_ticker, ticker, history.get(ticker)): ticker 
+        for ticker in missing
+    }
     
-    return results
+    for future in as_completed(future_to_ticker):
+        ticker = future_to_ticker[future]
+        try:
+            data = future.result()
+            if data:
+                _cache_store((ticker, period, today), data)
+                results[ticker] = dict(data)
+        except Exception as e:
+            logger.warning("Error processing %s: %s", ticker, e)
+    
+    # Keep the caller's ticker order
+    return {ticker: results[ticker] for ticker in tickers if ticker in results}
+
+def trailing_view(data: Dict, years: int = 1) -> Dict:
+    """
+    Restricts a `get_financial_data` entry to its trailing `years` of history.
+
+    Args:
+        data: One ticker's entry as returned by get_financial_data
+        years: Length of the trailing window in years
+
+    Returns:
+        A new entry with the sliced historical data and its price metrics
+        recomputed over that window; the input entry is not modified
+    """
+    hist = data['historical_data']
+    if hist.empty:
+        return dict(data)
+    start = hist['Date'].iloc[-1] - pd.DateOffset(years=years)
+    recent = hist.loc[hist['Date'] > start].reset_index(drop=True)
+
+    high, low, avg_vol, first, last, n_closes = ohlcv_metrics(
+        *(recent[col].to_numpy(dtype=np.float64) for col in ('High', 'Low', 'Close', 'Volume'))
+    )
+    return {
+        **data,
+        'current_price': last,
+        'price_change': ((last - first) / first) * 100,
+        'high_52week': high,
+        'low_52week': low,
+        'avg_volume': avg_vol,
+        'expected_return': annualized_log_return(first, last, n_closes),
+        'historical_data': recent,
+    }
+
+def validate_tickers(tickers: List[str]) -> Dict[str, Optional[bool]]:
+    """
+    Checks which tickers have market data using a few batched history requests,
+    instead of one info lookup per ticker.
+
+    Args:
+        tickers: List of stock/crypto ticker symbols
+
+    Returns:
+        Dict mapping each ticker to whether Yahoo returned recent prices for it, or to
+        None when its batch could not be downloaded and its validity is unknown
+    """
+    if not tickers:
+        return {}
+    unique = list(dict.fromkeys(tickers))
+    validity: Dict[str, Optional[bool]] = {}
+    for i in range(0, len(unique), _DOWNLOAD_BATCH_SIZE):
+        batch = unique[i:i + _DOWNLOAD_BATCH_SIZE]
+        try:
+            history = _download_batch(batch, period='5d')
+        except Exception as e:
+            # A failed request says nothing about the tickers, so don't report them invalid
+            logger.warning("Error validating %s: %s", ', '.join(batch), e)
+            validity.update(dict.fromkeys(batch))
+            continue
+        for ticker in batch:
+            validity[ticker] = ticker in history and not history[ticker].empty
+    return {ticker: validity[ticker] for ticker in tickers}
 
 def get_ticker_info(ticker: str) -> Optional[Dict]:
     """
@@ -178,9 +404,8 @@ def get_ticker_info(ticker: str) -> Optional[Dict]:
         Clean dictionary of ticker info or None if invalid
     """
     try:
-        print(f"Fetching info for {ticker}...")
-        stock = yf.Ticker(ticker)
-        info = stock.info
+        logger.debug("Fetching info for %s...", ticker)
+        info = _get_info(ticker)
         
         # Clean up the info dictionary
         if not info:
@@ -188,7 +413,7 @@ def get_ticker_info(ticker: str) -> Optional[Dict]:
             
         # Get currency and convert monetary values to INR
         currency = info.get('currency', 'USD') if '.NS' not in ticker else 'INR'
-        conversion_rate = 1.0 if currency == 'INR' else cr.get_rate(currency, 'INR')
+        conversion_rate = get_inr_rate(currency)
         
         # Return the most relevant fields with converted values
         relevant_fields = {
@@ -213,7 +438,7 @@ def get_ticker_info(ticker: str) -> Optional[Dict]:
         return {k: v for k, v in relevant_fields.items() if v is not None}
         
     except Exception as e:
-        print(f"Error fetching info for {ticker}: {str(e)}")
+        logger.warning("Error fetching info for %s: %s", ticker, e)
         return None
 
 
@@ -1,5 +1,8 @@
 import os
 import traceback
+from collections import defaultdict
+from functools import lru_cache
+import numpy as np
 from dotenv import load_dotenv
 
 # Attempt to robustly load .env from the project root
@@ -32,6 +35,41 @@ except Exception as e:
     print(f"Warning: google.generativeai import failed: {e}")
 
 
+# Static strategy blocks for the local fallback response, keyed by risk level
+_LOW_RISK_STRATEGY = """
+🔹 **Conservative Strategy Recommended**
+- Focus on blue-chip companies with stable dividends
+- Consider large-cap mutual funds
+- Maintain 70-30 split between equity and debt
+- Look for companies with strong fundamentals and consistent performance
+"""
+
+_MEDIUM_RISK_STRATEGY = """
+🔸 **Balanced Strategy Recommended**
+- Mix of growth stocks and value stocks
+- Consider mid-cap mutual funds for growth potential
+- Maintain 60-40 split between equity and growth stocks
+- Look for companies showing steady growth and innovation
+"""
+
+_HIGH_RISK_STRATEGY = """
+🔺 **Growth Strategy Recommended**
+- Focus on high-growth potential stocks
+- Consider small-cap and sector-specific funds
+- Higher allocation to emerging sectors
+- Look for companies with disruptive potential
+"""
+
+_RISK_STRATEGIES = {
+    "Low Risk": _LOW_RISK_STRATEGY,
+    "Medium Risk": _MEDIUM_RISK_STRATEGY,
+    "High Risk": _HIGH_RISK_STRATEGY,
+}
+
+# Conservative, moderate and aggressive annual returns (8%, 12%, 15%)
+_PROJECTION_RATES = np.array([0.08, 0.12, 0.15])
+
+
 def _local_fallback_response(user_inputs, financial_data_context, news_context):
     """Generate a detailed response without using external LLM service"""
     try:
@@ -66,30 +104,7 @@ Based on current market conditions and your risk profile, here's our analysis:
 
 """
         # Add risk-based recommendations
-        if risk_level == "Low Risk":
-            response += """
-🔹 **Conservative Strategy Recommended**
-- Focus on blue-chip companies with stable dividends
-- Consider large-cap mutual funds
-- Maintain 70-30 split between equity and debt
-- Look for companies with strong fundamentals and consistent performance
-"""
-        elif risk_level == "Medium Risk":
-            response += """
-🔸 **Balanced Strategy Recommended**
-- Mix of growth stocks and value stocks
-- Consider mid-cap mutual funds for growth potential
-- Maintain 60-40 split between equity and growth stocks
-- Look for companies showing steady growth and innovation
-"""
-        else:  # High Risk
-            response += """
-🔺 **Growth Strategy Recommended**
-- Focus on high-growth potential stocks
-- Consider small-cap and sector-specific funds
-- Higher allocation to emerging sectors
-- Look for companies with disruptive potential
-"""
+        response += _RISK_STRATEGIES.get(risk_level, _HIGH_RISK_STRATEGY)
 
         # Add market-specific recommendations
         if market_data:
@@ -104,13 +119,9 @@ Based on current market conditions and your risk profile, here's our analysis:
         # Add future projections
         monthly_investment = float(investment_amount)
         years = int(horizon)
-        conservative_return = 0.08  # 8% annual return
-        moderate_return = 0.12      # 12% annual return
-        aggressive_return = 0.15    # 15% annual return
-
-        future_conservative = monthly_investment * 12 * ((1 + conservative_return) ** years)
-        future_moderate = monthly_investment * 12 * ((1 + moderate_return) ** years)
-        future_aggressive = monthly_investment * 12 * ((1 + aggressive_return) ** years)
+        future_conservative, future_moderate, future_aggressive = (
+            monthly_investment * 12 * np.power(1 + _PROJECTION_RATES, years)
+        )
 
         response += f"""
 #### Potential Future Outcomes
@@ -132,27 +143,16 @@ Based on your monthly investment of ₹{investment_amount:,} over {horizon} year
         return "Fallback: Unable to generate LLM response due to internal error."
 
 
-def get_llm_response(user_inputs, financial_data_context, news_context):
-    """
-    Generates a personalized financial plan using the Gemini API when available.
-    Falls back to a safe local response if the API key or client is missing.
-    """
-    if not GENAI_CONFIGURED or genai is None:
-        return _local_fallback_response(user_inputs, financial_data_context, news_context)
-
-    try:
-        model = genai.GenerativeModel('gemini-1.5-flash')
-
-        # Constructing a detailed prompt for the LLM
-        prompt = f"""
+# Prompt for the Gemini model; filled in with str.format_map on each request
+_PROMPT_TEMPLATE = """
         **Role**: You are Monexa, an expert AI Financial Advisor. Your tone is encouraging, clear, and professional. Avoid overly technical jargon.
 
         **User Profile**:
-        - **Primary Goal**: {user_inputs.get('goal', 'Not specified')}
-        - **Monthly Savings**: ${user_inputs.get('savings', 'Not specified')}
-        - **Time Horizon**: {user_inputs.get('horizon', 'Not specified')} years
-        - **Risk Tolerance**: {user_inputs.get('risk', 'Not specified')}
-        - **Specific Tickers of Interest**: {', '.join(user_inputs.get('tickers', [])) if user_inputs.get('tickers') else 'None'}
+        - **Primary Goal**: {goal}
+        - **Monthly Savings**: ${savings}
+        - **Time Horizon**: {horizon} years
+        - **Risk Tolerance**: {risk}
+        - **Specific Tickers of Interest**: {tickers}
 
         **Market Context**:
         - **Recent Financial News Summary**: {news_context}
@@ -172,10 +172,81 @@ def get_llm_response(user_inputs, financial_data_context, news_context):
         **IMPORTANT**: Do not give definitive financial advice. Use phrases like "You might consider...", "A common strategy is...", or "It could be beneficial to look into...". Always remind the user to consult a human financial advisor.
         """
 
+
+# Appended when the model stream fails part way, so a cut-off plan is visibly incomplete
+_INTERRUPTED_NOTICE = "\n\n⚠️ *The response was interrupted before it finished. Please try again.*"
+
+
+class PlanStream:
+    """
+    Iterable of the text chunks of a streamed plan. `completed` becomes True only once the
+    model has sent the whole plan, so callers can tell a finished plan from a partial one
+    or the local fallback.
+    """
+
+    def __init__(self, response, user_inputs, financial_data_context, news_context):
+        self._response = response  # None streams the local fallback response
+        self._fallback_args = (user_inputs, financial_data_context, news_context)
+        self.completed = False
+
+    def __iter__(self):
+        if self._response is None:
+            yield _local_fallback_response(*self._fallback_args)
+            return
+
+        emitted = False
+        try:
+            for chunk in self._response:
+                text = chunk.text
+                if text:
+                    emitted = True
+                    yield text
+        except Exception as e:
+            print(f"An error occurred while streaming the LLM response: {e}\n{traceback.format_exc()}")
+            # Only fall back if nothing has been shown yet, to avoid mixing two responses
+            yield _INTERRUPTED_NOTICE if emitted else _local_fallback_response(*self._fallback_args)
+            return
+        self.completed = emitted
+
+
+@lru_cache(maxsize=1)
+def _get_model():
+    """Builds the Gemini model once per process so reruns reuse its client and connections"""
+    return genai.GenerativeModel('gemini-1.5-flash')
+
+
+def get_llm_response(user_inputs, financial_data_context, news_context, stream=False):
+    """
+    Generates a personalized financial plan using the Gemini API when available.
+    Falls back to a safe local response if the API key or client is missing.
+
+    With stream=True a PlanStream of text chunks is returned instead of the full
+    string, so callers can render the plan as it is generated.
+    """
+    if not GENAI_CONFIGURED or genai is None:
+        if stream:
+            return PlanStream(None, user_inputs, financial_data_context, news_context)
+        return _local_fallback_response(user_inputs, financial_data_context, news_context)
+
+    try:
+        model = _get_model()
+
+        # Constructing a detailed prompt for the LLM from the precompiled template
+        fields = defaultdict(lambda: 'Not specified', user_inputs)
+        fields['tickers'] = ', '.join(user_inputs['tickers']) if user_inputs.get('tickers') else 'None'
+        fields['news_context'] = news_context
+        fields['financial_data_context'] = financial_data_context
+        prompt = _PROMPT_TEMPLATE.format_map(fields)
+
+        if stream:
+            response = model.generate_content(prompt, stream=True)
+            return PlanStream(response, user_inputs, financial_data_context, news_context)
+
         response = model.generate_content(prompt)
         return response.text
 
     except Exception as e:
         print(f"An error occurred in get_llm_response: {e}\n{traceback.format_exc()}")
+        if stream:
+            return PlanStream(None, user_inputs, financial_data_context, news_context)
         return _local_fallback_response(user_inputs, financial_data_context, news_context)
-
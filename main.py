@@ -1,19 +1,26 @@
 import streamlit as st
-import plotly.express as px
 import pandas as pd
+import numpy as np
 import sys
 import os
+import functools
 
 # Add the project's root directory to the Python path
-# This allows for absolute imports from the 'backend' package
+# This allows for absolute imports from the 'backend' package.
+# Streamlit re-executes this script on every rerun, so only insert it once.
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-sys.path.insert(0, project_root)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 try:
     # Use absolute imports from the backend package
-    from backend.finance_service import get_financial_data, calculate_expected_return, get_ticker_info
+    from backend.finance_service import get_financial_data, calculate_expected_returns, trailing_view, validate_tickers
     from backend.news_service import get_financial_news, summarize_news_for_llm
     from backend.llm_service import get_llm_response
+    from backend.constants import (
+        INDIAN_STOCKS, US_STOCKS, NEWS_DATA,
+        SCENARIO_NAMES, SCENARIO_RATES, SCENARIO_COLORS, PROJECTION_YEARS
+    )
 except ImportError as e:
     st.error(f"Error importing backend services: {e}. Please ensure the backend files exist in a 'backend' folder at the project root.")
     st.stop()
@@ -26,26 +33,260 @@ st.set_page_config(
     layout="wide"
 )
 
-# --- Market Data Constants ---
-INDIAN_STOCKS = {
-    "Low Risk": ["HDFCBANK.NS", "TCS.NS", "HINDUNILVR.NS", "INFY.NS", "RELIANCE.NS"],
-    "Medium Risk": ["ICICIBANK.NS", "AXISBANK.NS", "SBIN.NS", "LT.NS", "MARUTI.NS"],
-    "High Risk": ["TATAMOTORS.NS", "ZOMATO.NS", "PAYTM.NS", "YESBANK.NS", "IDEA.NS"]
-}
+# --- Cached Data Access ---
+# Streamlit reruns the whole script on every interaction, so memoize the network-bound calls.
+# Tickers are passed as tuples so the arguments are hashable cache keys.
+# Daily histories are persisted to disk so they survive restarts. Persisted caches don't
+# support a TTL, so callers pass the trading day (`as_of`) to roll the key over daily.
+class _IncompleteResult(Exception):
+    """
+    Raised from a cached call to hand back a partial result without caching it, since
+    st.cache_data never stores calls that raise. The partial result is in `result`.
+    """
+    def __init__(self, result):
+        super().__init__("incomplete result")
+        self.result = result
+
+@st.cache_data(persist="disk", max_entries=256, show_spinner=False)
+def _cached_financial_data(tickers, market="INDIA", period="1y", as_of=None):
+    data = get_financial_data(list(tickers), period=period, market=market)
+    # A transient Yahoo failure would otherwise be served from disk for the rest of the day
+    if any(ticker not in data for ticker in tickers):
+        raise _IncompleteResult(data)
+    return data
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_validate_tickers(tickers):
+    validity = validate_tickers(tickers)
+    # None marks a failed lookup, which should be retried rather than remembered
+    if any(valid is None for valid in validity.values()):
+        raise _IncompleteResult(validity)
+    return validity
+
+# Input normalization runs on every rerun, so memoize it on the raw widget text
+@st.cache_data(max_entries=256, show_spinner=False)
+def parse_tickers(raw):
+    """Splits a comma-separated ticker list into upper-cased symbols, skipping blanks"""
+    return tuple(ticker.strip().upper() for ticker in raw.split(',') if ticker.strip())
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def normalize_stock_search(raw, market):
+    """Upper-cases a searched symbol, adding the .NS suffix for Indian stocks if missing"""
+    symbol = raw.strip().upper()
+    if symbol and market == "Indian Market" and not symbol.endswith(".NS"):
+        symbol += ".NS"
+    return symbol
+
+# The expected-return stats only change with the price history, so key them on a cheap
+# signature of each history (see _history_signature) instead of hashing the frames
+@st.cache_data(max_entries=64, show_spinner=False)
+def _cached_expected_returns(signatures, _close_series):
+    # Sorted so each ticker's first and last closes are read in date order
+    return calculate_expected_returns(pd.concat(_close_series, axis=1, sort=True))
+
+@st.cache_data(show_spinner=False)
+def _news_digest():
+    """LLM summary and rendered markdown of the static news list"""
+    news_context = summarize_news_for_llm(NEWS_DATA)
+    # Rendered as a single markdown element rather than several per article
+    news_body = "\n\n---\n\n".join(
+        f"### 📌 {article['title']}\n\n"
+        f"{article['description']}\n\n"
+        f"*Source: {article['source']}* · *{article['published']}*"
+        + (f"\n\n[🔗 Read full article]({article['url']})" if article.get('url') else "")
+        for article in NEWS_DATA[:10]
+    )
+    return news_context, news_body
+
+def _llm_cache_key(user_inputs, financial_data_context, news_context):
+    """Hashable key for an LLM request; list inputs such as tickers become tuples"""
+    inputs = tuple(sorted(
+        (field, tuple(value) if isinstance(value, list) else value)
+        for field, value in user_inputs.items()
+    ))
+    return inputs, financial_data_context, news_context
+
+# --- Chart Builders ---
+# Plotly is slow to import and only needed once a chart is drawn, so defer it past the first paint
+@functools.cache
+def _px():
+    import plotly.express as px
+    return px
+
+# Figures are rebuilt from the same frames on every rerun, so share them as cached resources.
+# The frames themselves are passed as underscore arguments (not hashed); a cheap signature of
+# each history identifies the data instead. Callers only render the figures.
+def _history_signature(hist_df):
+    """Cheap fingerprint of a price history: length plus the last date and close"""
+    return len(hist_df), str(hist_df['Date'].iloc[-1]), float(hist_df['Close'].iloc[-1])
+
+@st.cache_resource(max_entries=128, show_spinner=False)
+def _price_figure(ticker, signature, _hist_df):
+    return _px().line(_hist_df, x='Date', y='Close',
+                      title=f'Price History (₹)',
+                      labels={'Close': 'Price (₹)', 'Date': 'Date'},
+                      render_mode='webgl')  # WebGL keeps long daily series responsive
+
+@st.cache_resource(max_entries=128, show_spinner=False)
+def _volume_figure(ticker, signature, _hist_df):
+    # Weekly totals keep the bar count manageable for a year of daily data
+    weekly_volume = _hist_df.set_index('Date')['Volume'].resample('W').sum().reset_index()
+    return _px().bar(weekly_volume, x='Date', y='Volume',
+                     title=f'Weekly Trading Volume - {ticker}',
+                     labels={'Volume': 'Volume', 'Date': 'Week'})
+
+def _normalized_closes(closes, base):
+    """Aligns close series on date and scales each one to `base` at its first available close"""
+    # The markets trade on different calendars, so sort the union of their dates explicitly
+    prices = pd.concat(closes, axis=1, sort=True).ffill().dropna(how='all')  # Carry prices over other markets' holidays
+    return prices.div(prices.bfill().iloc[0]).mul(base)
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _comparison_figure(signatures, _closes):
+    return _px().line(_normalized_closes(_closes, 100),
+                      title='Price Comparison (Normalized)',
+                      labels={'value': 'Normalized Price (%)', 'Date': 'Date'},
+                      render_mode='webgl')
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _performance_figure(signatures, _closes, initial_investment):
+    fig = _px().line(
+        _normalized_closes(_closes, initial_investment),
+        title=f'Historical Performance of ₹{initial_investment:,} Investment',
+        labels={'value': 'Portfolio Value (₹)', 'variable': 'Investment'},
+        render_mode='webgl'  # Five years of daily points per ticker
+    )
+    fig.update_layout(
+        showlegend=True,
+        yaxis_title='Value (₹)',
+        xaxis_title='Date',
+        hovermode='x unified'
+    )
+    return fig
+
+# --- Projection Helpers ---
+# Monthly scenario rates as a column vector, so they broadcast against the month axis
+_MONTHLY_SCENARIO_RATES = np.array(SCENARIO_RATES)[:, None] / 12
+
+def calculate_future_value(monthly_amount, rate, years):
+    """Future value of a monthly annuity; `rate` may be a scalar or an array of annual rates"""
+    monthly_rate = np.asarray(rate, dtype=float) / 12
+    n_months = years * 12
+    # expm1/log1p keep (1 + r)**n - 1 accurate for small monthly rates
+    return monthly_amount * np.expm1(n_months * np.log1p(monthly_rate)) / monthly_rate
+
+# The projection only depends on (amount, years), so reruns from unrelated widgets reuse it
+@st.cache_data(max_entries=64, show_spinner=False)
+def build_projection_frame(monthly_investment, years):
+    """
+    Month-by-month growth of each scenario, computed for all months and rates at once.
+    Returns the long form (Month, Scenario, Value) used for plotting.
+    """
+    months = np.arange(years * 12 + 1)
+    # Compound growth per month as a running product of the monthly factors (no pow per month)
+    growth = np.ones((len(SCENARIO_NAMES), months.size))
+    np.cumprod(
+        np.broadcast_to(1 + _MONTHLY_SCENARIO_RATES, (len(SCENARIO_NAMES), months.size - 1)),
+        axis=1, out=growth[:, 1:]
+    )
+    # Value of the monthly contributions so far, the same annuity as calculate_future_value
+    grid = monthly_investment * (growth - 1) / _MONTHLY_SCENARIO_RATES
+
+    # Build the long form straight from the (scenario x month) grid instead of melting a wide frame.
+    # A categorical label serializes as small codes instead of one string per row.
+    return pd.DataFrame({
+        'Month': np.tile(months, len(SCENARIO_NAMES)),
+        'Scenario': pd.Categorical.from_codes(
+            np.repeat(np.arange(len(SCENARIO_NAMES)), months.size), categories=list(SCENARIO_NAMES)
+        ),
+        'Value': grid.ravel(),
+    })
+
+# Figures aren't serializable cache values, so share the built figure as a resource.
+# Callers only render it and must not modify it.
+@st.cache_resource(max_entries=64, show_spinner=False)
+def build_projection_figure(monthly_investment, years):
+    """Line chart of the projected portfolio value for every scenario"""
+    proj_melted = build_projection_frame(monthly_investment, years)
+    fig_proj = _px().line(
+        proj_melted,
+        x='Month',
+        y='Value',
+        color='Scenario',
+        title=f'Investment Growth Projection Over {years} Years',
+        labels={'Value': 'Portfolio Value (₹)', 'Month': 'Months'},
+        color_discrete_map=dict(SCENARIO_COLORS)
+    )
+    fig_proj.update_layout(
+        hovermode='x unified',
+        yaxis_title='Portfolio Value (₹)',
+        xaxis_title='Months',
+        legend_title='Growth Scenario',
+        # Format y-axis values to show as currency
+        yaxis=dict(tickformat=',.0f', tickprefix='₹')
+    )
+    return fig_proj
+
+# Whole-rupee amount with thousands separators, e.g. 150000.4 -> "₹150,000"
+_format_inr = "₹{:,.0f}".format
 
-US_STOCKS = {
-    "Low Risk": ["MSFT", "AAPL", "JNJ", "PG", "KO"],
-    "Medium Risk": ["GOOGL", "AMZN", "META", "NVDA", "V"],
-    "High Risk": ["TSLA", "PLTR", "RIVN", "COIN", "GME"]
-}
+def render_projection_calculator(monthly_investment, projection_years, key_prefix):
+    """
+    Renders the projection chart, the final value per scenario and the investment breakdown.
+    Shared by both calculators; `key_prefix` keeps their element keys unique.
+    """
+    future_values = calculate_future_value(monthly_investment, SCENARIO_RATES, projection_years)
+    total_invested = monthly_investment * 12 * projection_years
+
+    # Create projection visualization
+    fig_proj = build_projection_figure(monthly_investment, projection_years)
+    st.plotly_chart(fig_proj, use_container_width=True, key=f"{key_prefix}_projection_chart")
+
+    # Display final values
+    st.markdown("#### Projected Final Values")
+    for column, name, rate, future_value in zip(st.columns(3), SCENARIO_NAMES, SCENARIO_RATES, future_values):
+        with column:
+            st.metric(
+                f"{name} ({rate:.0%} p.a.)",
+                _format_inr(future_value),
+                "+" + _format_inr(future_value - total_invested)
+            )
+
+    # Add investment breakdown
+    moderate_fv = future_values[SCENARIO_NAMES.index('Moderate')]
+    st.markdown("#### Investment Breakdown")
+    st.info(f"""
+    💰 Total Investment: {_format_inr(total_invested)}
+    📈 Potential Returns (Moderate scenario): {_format_inr(moderate_fv - total_invested)}
+    🎯 Monthly Investment: {_format_inr(monthly_investment)}
+    ⏳ Investment Period: {projection_years} years
+    """)
 
-CRYPTO_TICKERS = ["BTC-USD", "ETH-USD", "BNB-USD", "XRP-USD", "SOL-USD"]
+@st.fragment
+def _render_analysis_calculator(default_monthly_investment):
+    """
+    Projection controls under the historical performance chart. Changing them reruns only
+    this fragment, so the rest of the analysis stays on screen without being rebuilt.
+    """
+    st.markdown("##### Investment Projection Calculator")
+    col1, col2 = st.columns(2)
+    with col1:
+        monthly_investment = st.number_input(
+            "Monthly Investment (₹)",
+            min_value=1000,
+            max_value=1000000,
+            value=default_monthly_investment,
+            step=1000
+        )
+    with col2:
+        projection_years = st.selectbox(
+            "Projection Period",
+            options=PROJECTION_YEARS,
+            index=2  # Default to 5 years
+        )
 
-MUTUAL_FUNDS = {
-    "Large Cap": ["HDFC Top 100", "Axis Bluechip", "Mirae Asset Large Cap"],
-    "Mid Cap": ["Kotak Emerging Equity", "HDFC Mid-Cap Opportunities", "DSP Midcap"],
-    "Small Cap": ["Nippon Small Cap", "SBI Small Cap", "Axis Small Cap"]
-}
+    # Calculate and show projections
+    render_projection_calculator(monthly_investment, projection_years, key_prefix="analysis")
 
 # --- UI Rendering ---
 # Main header with columns for better layout
@@ -69,53 +310,56 @@ with st.sidebar:
 
     user_inputs = {"investment_type": investment_type}
 
-    # Market Selection for Stocks
-    if investment_type == "Stocks":
-        market = st.selectbox(
-            "Which market would you like to invest in?",
-            ("Indian Market", "US Market"),
-            help="Select the stock market you want to invest in"
-        )
-        user_inputs["market"] = market
-
-        # Stock search
-        stock_search = st.text_input(
-            "Search for specific stocks:",
-            placeholder="e.g., RELIANCE.NS or AAPL",
-            help="Enter stock symbol to search"
+    # The remaining inputs only take effect on submit, so editing them doesn't rerun the app.
+    # The investment type stays outside the form because it decides which fields are shown.
+    with st.form("profile_form", border=False):
+        # Market Selection for Stocks
+        if investment_type == "Stocks":
+            market = st.selectbox(
+                "Which market would you like to invest in?",
+                ("Indian Market", "US Market"),
+                help="Select the stock market you want to invest in"
+            )
+            user_inputs["market"] = market
+
+            # Stock search
+            stock_search = st.text_input(
+                "Search for specific stocks:",
+                placeholder="e.g., RELIANCE.NS or AAPL",
+                help="Enter stock symbol to search"
+            )
+            user_inputs["stock_search"] = stock_search
+
+        # Common inputs for all investment types
+        user_inputs["investment_amount"] = st.number_input(
+            "How much can you invest monthly (₹)?",
+            min_value=0, step=1000, value=5000,
+            help="Enter the amount you can comfortably invest each month in INR",
+            key="sidebar_investment_amount"
         )
-        user_inputs["stock_search"] = stock_search
-
-    # Common inputs for all investment types
-    user_inputs["investment_amount"] = st.number_input(
-        "How much can you invest monthly (₹)?",
-        min_value=0, step=1000, value=5000,
-        help="Enter the amount you can comfortably invest each month in INR",
-        key="sidebar_investment_amount"
-    )
     
-    user_inputs["horizon"] = st.slider(
-        "What is your investment horizon?",
-        min_value=1, max_value=30, value=10, format="%d years",
-        help="How many years are you planning to invest for?"
-    )
+        user_inputs["horizon"] = st.slider(
+            "What is your investment horizon?",
+            min_value=1, max_value=30, value=10, format="%d years",
+            help="How many years are you planning to invest for?"
+        )
     
-    user_inputs["risk"] = st.select_slider(
-        "What is your risk tolerance?",
-        options=["Low Risk", "Medium Risk", "High Risk"], 
-        value="Medium Risk",
-        help="Low risk aims for stable returns. High risk has potential for higher growth but also higher volatility."
-    )
+        user_inputs["risk"] = st.select_slider(
+            "What is your risk tolerance?",
+            options=["Low Risk", "Medium Risk", "High Risk"], 
+            value="Medium Risk",
+            help="Low risk aims for stable returns. High risk has potential for higher growth but also higher volatility."
+        )
     
-    custom_tickers_input = st.text_area(
-        "Track specific tickers (optional):",
-        placeholder="e.g., GOOGL, BTC-USD, AMZN",
-        help="Enter any stock or crypto tickers you want to include in the analysis, separated by commas."
-    )
-    if custom_tickers_input:
-        user_inputs["tickers"] = [ticker.strip().upper() for ticker in custom_tickers_input.split(',') if ticker.strip()]
+        custom_tickers_input = st.text_area(
+            "Track specific tickers (optional):",
+            placeholder="e.g., GOOGL, BTC-USD, AMZN",
+            help="Enter any stock or crypto tickers you want to include in the analysis, separated by commas."
+        )
+        if custom_tickers_input:
+            user_inputs["tickers"] = list(parse_tickers(custom_tickers_input))
     
-    analyze_button = st.button("✨ Get My Personalized Advice", use_container_width=True, type="primary")
+        analyze_button = st.form_submit_button("✨ Get My Personalized Advice", use_container_width=True, type="primary")
 
 # --- Helper function to display results ---
 def validate_inputs(user_inputs):
@@ -137,63 +381,70 @@ def validate_inputs(user_inputs):
         return False
     return True
 
+@st.fragment
+def _render_stock_views(stock_data):
+    """
+    Price, volume and comparison charts for the fetched stocks. Only the selected view is
+    built, and switching views reruns just this fragment instead of the whole page.
+    """
+    view = st.radio(
+        "View",
+        ["Price History", "Volume Analysis", "Comparison"],
+        horizontal=True,
+        key="stock_view",
+        label_visibility="collapsed"
+    )
+
+    if view == "Price History":
+        for ticker, data in stock_data.items():
+            st.subheader(f"{data['name']} ({ticker})")
+            hist_df = data['historical_data']
+
+            # Price history chart
+            fig = _price_figure(ticker, _history_signature(hist_df), hist_df)
+            st.plotly_chart(fig, use_container_width=True)
+
+            # Key metrics
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Current Price", f"₹{data['current_price']:,.2f}")
+            col2.metric("Change", f"{data['price_change']:,.2f}%")
+            col3.metric("52W High", f"₹{data['high_52week']:,.2f}")
+            col4.metric("52W Low", f"₹{data['low_52week']:,.2f}")
+
+    elif view == "Volume Analysis":
+        for ticker, data in stock_data.items():
+            hist_df = data['historical_data']
+            fig = _volume_figure(ticker, _history_signature(hist_df), hist_df)
+            # Volume bars don't need hover/zoom, so render them as static images
+            st.plotly_chart(fig, use_container_width=True,
+                            config={'staticPlot': True, 'displayModeBar': False})
+
+    else:
+        # Normalize prices for comparison, aligning all tickers on date in one concat
+        closes = {ticker: data['historical_data'].set_index('Date')['Close']
+                  for ticker, data in stock_data.items()}
+        signatures = tuple((ticker, _history_signature(data['historical_data']))
+                           for ticker, data in stock_data.items())
+        fig = _comparison_figure(signatures, closes)
+        st.plotly_chart(fig, use_container_width=True)
+
 def display_results(user_inputs):
     """Encapsulates the logic to fetch data, generate insights, and render UI elements."""
     try:
         # 1. Get Investment Type and Market Selection
         investment_type = user_inputs.get("investment_type")
         risk_level = user_inputs.get("risk", "Medium Risk")
+        tickers_to_chart = []
+        hist_data = {}
         
         # 2. Fetch and Display Latest Market News
         # 2. Display Latest Market News
         st.subheader("📰 Latest Market News & Analysis")
-        # Static news data to ensure consistent display
-        news_data = [
-                {
-                    'title': 'Global Markets Show Strong Recovery',
-                    'description': 'Major global indices demonstrate resilience as markets recover from recent volatility. Tech and financial sectors lead the gains.',
-                    'source': 'Market Analysis Daily',
-                    'published': 'Today',
-                    'url': 'https://example.com/markets'
-                },
-                {
-                    'title': 'Tech Stocks Continue Upward Trend',
-                    'description': 'Technology sector maintains momentum as AI and cloud computing companies report strong quarterly earnings.',
-                    'source': 'Tech Finance Weekly',
-                    'published': 'Today',
-                    'url': 'https://example.com/tech'
-                },
-                {
-                    'title': 'Emerging Markets Present New Opportunities',
-                    'description': 'Analysts identify promising investment opportunities in emerging markets as economic indicators show positive trends.',
-                    'source': 'Global Investment Review',
-                    'published': 'Today',
-                    'url': 'https://example.com/emerging'
-                },
-                {
-                    'title': 'Sustainable Investments Gain Traction',
-                    'description': 'ESG-focused investments continue to attract capital as investors prioritize sustainable and responsible investing.',
-                    'source': 'Sustainable Finance Today',
-                    'published': 'Today',
-                    'url': 'https://example.com/esg'
-                }
-            ]
-        
-        if isinstance(news_data, list) and news_data:
-            news_context = summarize_news_for_llm(news_data)
-            
-            # Display news in a clean format
-            for article in news_data:
-                with st.container(border=True):
-                    st.markdown(f"### 📌 {article['title']}")
-                    st.markdown(f"{article['description']}")
-                    col1, col2 = st.columns([3, 1])
-                    with col1:
-                        st.markdown(f"*Source: {article['source']}*")
-                    with col2:
-                        st.markdown(f"*{article['published']}*")
-                    if article.get('url'):
-                        st.markdown(f"[🔗 Read full article]({article['url']})")
+        if NEWS_DATA:
+            # The news is static, so its LLM summary and markdown are built once and cached
+            news_context, news_body = _news_digest()
+            with st.container(border=True):
+                st.markdown(news_body)
         else:
             st.warning("⚠️ Could not fetch latest news. Please try again later.")
             news_context = "No recent financial news available."
@@ -205,13 +456,10 @@ def display_results(user_inputs):
             
             # Display top stocks based on risk level
             st.subheader(f"📈 Top {market.split()[0]} Stocks - {risk_level}")
-            tickers_to_chart = stock_list.get(risk_level, [])[:]  # Make a copy
+            tickers_to_chart = list(stock_list.get(risk_level, ()))
             # Handle custom stock search
-            custom_stock = user_inputs.get("stock_search", "").strip().upper()
+            custom_stock = normalize_stock_search(user_inputs.get("stock_search", ""), market)
             if custom_stock:
-                # Add .NS suffix for Indian stocks if not present
-                if market == "Indian Market" and not custom_stock.endswith(".NS"):
-                    custom_stock += ".NS"
                 tickers_to_chart.insert(0, custom_stock)  # Add to beginning of list
 
             # Initialize validation lists
@@ -219,314 +467,199 @@ def display_results(user_inputs):
             valid_custom = []
             
             # Handle custom tickers if provided
-            custom_tickers = user_inputs.get("tickers", [])
+            custom_tickers = [ticker for ticker in user_inputs.get("tickers", []) if ticker]  # Skip empty strings
             if custom_tickers:
-                for ticker in custom_tickers:
-                    if ticker:  # Skip empty strings
-                        info = get_ticker_info(ticker)
-                        if info:
-                            valid_custom.append(ticker)
-                        else:
-                            invalid_tickers.append(ticker)
+                # Remember each ticker's validity for the session, so adding one new ticker
+                # only validates that one; the unknown ones are still checked in one batched lookup
+                validity = st.session_state.setdefault('ticker_validity_cache', {})
+                unknown_tickers = tuple(ticker for ticker in dict.fromkeys(custom_tickers) if ticker not in validity)
+                if unknown_tickers:
+                    try:
+                        checked = _cached_validate_tickers(unknown_tickers)
+                    except _IncompleteResult as e:
+                        checked = e.result
+                    # Only remember definite answers; failed lookups are retried on the next run
+                    validity.update((ticker, valid) for ticker, valid in checked.items() if valid is not None)
+                valid_custom = [ticker for ticker in custom_tickers if validity.get(ticker)]
+                invalid_tickers = [ticker for ticker in custom_tickers if validity.get(ticker) is False]
+                # None means the lookup itself failed, which says nothing about the ticker
+                unchecked_tickers = [ticker for ticker in custom_tickers if validity.get(ticker) is None]
                 
                 if invalid_tickers:
                     st.warning(f"Could not find data for these tickers: {', '.join(invalid_tickers)}. They will be ignored.")
+                if unchecked_tickers:
+                    st.warning(f"Could not check these tickers right now: {', '.join(unchecked_tickers)}. Please try again shortly.")
                 if valid_custom:
-                    tickers_to_chart.extend(valid_custom)
-                    tickers_to_chart = list(dict.fromkeys(tickers_to_chart))  # Remove duplicates while preserving order
+                    # Append in one pass, skipping duplicates while preserving order
+                    seen = set()
+                    tickers_to_chart = [ticker for ticker in (*tickers_to_chart, *valid_custom)
+                                        if not (ticker in seen or seen.add(ticker))]
             
             # Fetch and display stock data
+            market_code = market.split()[0].upper()
+            # Reruns that only change non-ticker inputs (amount, horizon, ...) reuse the last fetch.
+            # The date is part of the key so a long-lived session still picks up new daily closes,
+            # and the ticker order is too, since it sets the order of the charts.
+            as_of = pd.Timestamp.today().date().isoformat()
+            stock_data_key = (tuple(tickers_to_chart), market_code, as_of)
             with st.spinner(f"Fetching {market} stock data..."):
-                stock_data = get_financial_data(tickers_to_chart, market=market.split()[0].upper())
+                if st.session_state.get('last_stock_data_key') == stock_data_key:
+                    stock_data, hist_data = st.session_state['last_stock_data']
+                else:
+                    # Fetch the 5y history once; the tabs below show the trailing year sliced from it
+                    try:
+                        hist_data = _cached_financial_data(tuple(tickers_to_chart), market_code, "5y", as_of)
+                        complete = True
+                    except _IncompleteResult as e:
+                        # Show what did load, but fetch again next time rather than keep the gaps
+                        hist_data = e.result
+                        complete = False
+                    stock_data = {ticker: trailing_view(data, years=1) for ticker, data in hist_data.items()}
+                    if complete:
+                        st.session_state['last_stock_data_key'] = stock_data_key
+                        st.session_state['last_stock_data'] = (stock_data, hist_data)
                 
                 if stock_data:
-                    # Create tabs for different visualizations
-                    price_tab, volume_tab, compare_tab = st.tabs(["Price History", "Volume Analysis", "Comparison"])
-                    
-                    with price_tab:
-                        for ticker, data in stock_data.items():
-                            st.subheader(f"{data['name']} ({ticker})")
-                            hist_df = data['historical_data']
-                            
-                            # Price history chart
-                            fig = px.line(hist_df, x='Date', y='Close',
-                                        title=f'Price History (₹)',
-                                        labels={'Close': 'Price (₹)', 'Date': 'Date'})
-                            st.plotly_chart(fig, use_container_width=True)
-                            
-                            # Key metrics
-                            col1, col2, col3, col4 = st.columns(4)
-                            col1.metric("Current Price", f"₹{data['current_price']:,.2f}")
-                            col2.metric("Change", f"{data['price_change']:,.2f}%")
-                            col3.metric("52W High", f"₹{data['high_52week']:,.2f}")
-                            col4.metric("52W Low", f"₹{data['low_52week']:,.2f}")
-                    
-                    with volume_tab:
-                        for ticker, data in stock_data.items():
-                            hist_df = data['historical_data']
-                            fig = px.bar(hist_df, x='Date', y='Volume',
-                                       title=f'Trading Volume - {ticker}',
-                                       labels={'Volume': 'Volume', 'Date': 'Date'})
-                            st.plotly_chart(fig, use_container_width=True)
-                    
-                    with compare_tab:
-                        # Normalize prices for comparison
-                        comparison_df = pd.DataFrame()
-                        for ticker, data in stock_data.items():
-                            hist_df = data['historical_data']
-                            comparison_df[ticker] = hist_df['Close'] / hist_df['Close'].iloc[0] * 100
-                        
-                        comparison_df.index = next(iter(stock_data.values()))['historical_data']['Date']
-                        fig = px.line(comparison_df, 
-                                    title='Price Comparison (Normalized)',
-                                    labels={'value': 'Normalized Price (%)', 'Date': 'Date'})
-                        st.plotly_chart(fig, use_container_width=True)
-
-            # 3. Fetch Financial Data
+                    _render_stock_views(stock_data)
+
+            # 3. Summarize the already fetched market data
             if tickers_to_chart:
-                with st.spinner("Fetching market data..."):
-                    # Get current market data
-                    market_data = get_financial_data(tickers_to_chart)
+                # The overview reads the same prices as the tabs above, so reuse that fetch
+                market_data = stock_data
+                
+                if market_data:
+                    # Display current market overview
+                    st.subheader("📊 Market Overview")
+                    # One table element instead of a column + metric pair per ticker
+                    overview = pd.DataFrame({
+                        'Name': [data.get('name', ticker) for ticker, data in market_data.items()],
+                        'Price': [data['current_price'] for data in market_data.values()],
+                        'Change %': [data['price_change'] for data in market_data.values()],
+                    }, index=list(market_data.keys()))
+                    st.dataframe(
+                        overview,
+                        use_container_width=True,
+                        column_config={
+                            'Price': st.column_config.NumberColumn('Price (₹)', format="₹%.2f"),
+                            'Change %': st.column_config.NumberColumn('Change', format="%+.1f%%"),
+                        }
+                    )
                     
-                    if market_data:
-                        # Display current market overview
-                        st.subheader("📊 Market Overview")
-                        cols = st.columns(len(market_data))
-                        for idx, (ticker, data) in enumerate(market_data.items()):
-                            with cols[idx]:
-                                st.metric(
-                                    label=f"{data.get('name', ticker)}",
-                                    value=f"₹{data['current_price']:,.2f}",
-                                    delta=f"{data['price_change']:.1f}%"
-                                )
-                        
-                        # Create financial context for LLM
-                        summaries = []
-                        for ticker, data in market_data.items():
-                            summary = (
-                                f"{ticker}: Current=${data['current_price']:.2f}, "
-                                f"Change={data['price_change']:.1f}%, "
-                                f"52w-High=${data['high_52week']:.2f}"
-                            )
-                            summaries.append(summary)
-                        financial_data_context = "Market Data:\n" + "\n".join(summaries)
-                    else:
-                        st.warning("Could not fetch current market data.")
-                        financial_data_context = "No market data available."
+                    # Create financial context for LLM
+                    summaries = []
+                    for ticker, data in market_data.items():
+                        summary = (
+                            f"{ticker}: Current=${data['current_price']:.2f}, "
+                            f"Change={data['price_change']:.1f}%, "
+                            f"52w-High=${data['high_52week']:.2f}"
+                        )
+                        summaries.append(summary)
+                    financial_data_context = "Market Data:\n" + "\n".join(summaries)
+                else:
+                    st.warning("Could not fetch current market data.")
+                    financial_data_context = "No market data available."
             else:
                 financial_data_context = "No specific tickers to analyze."
 
             # 4. Get and Display AI Analysis
             with st.spinner("Generating AI analysis..."):
-                llm_response = get_llm_response(user_inputs, financial_data_context, news_context)
-                
                 st.subheader("💡 Your AI-Generated Plan")
                 with st.container(border=True):
-                    st.markdown(llm_response)
+                    # Identical inputs produce the same plan, so reuse it instead of paying for another LLM call
+                    llm_key = _llm_cache_key(user_inputs, financial_data_context, news_context)
+                    llm_cache = st.session_state.setdefault('llm_responses', {})
+                    if llm_key in llm_cache:
+                        llm_response = llm_cache[llm_key]
+                        st.markdown(llm_response)
+                    else:
+                        # Stream the plan so the first words show up while the rest is generated
+                        plan_stream = get_llm_response(user_inputs, financial_data_context, news_context, stream=True)
+                        llm_response = st.write_stream(plan_stream)
+                        # Only keep plans the model finished, not cut-off streams or the local fallback
+                        if plan_stream.completed:
+                            llm_cache[llm_key] = llm_response
 
         # 6. Visualization and Investment Projections
-        if tickers_to_chart:
-            st.subheader("📊 Investment Analysis & Projections")
-            with st.container(border=True):
-                hist_data = get_financial_data(tickers_to_chart, period="5y")
+        # Only the Stocks path selects tickers; there is nothing to chart otherwise
+        if not tickers_to_chart:
+            st.info("No tickers to analyze.")
+            return
+
+        st.subheader("📊 Investment Analysis & Projections")
+        with st.container(border=True):
+            if not hist_data:  # Check if dictionary is empty
+                st.warning("Could not fetch historical data for visualization.")
+                return
+
+            tab1, tab2, tab3 = st.tabs(["📈 Historical Performance", "📊 Expected Returns", "🔮 Future Projections"])
+
+            with tab1:
+                st.markdown("##### Historical Growth Analysis")
+                st.markdown("This chart shows how your selected investments have performed historically.")
+
+                # Create historical performance visualization
+                initial_investment = 10000  # ₹10,000 base investment
+                closes = {
+                    ticker: data['historical_data'].set_index('Date')['Close']
+                    for ticker, data in hist_data.items()
+                    if isinstance(data.get('historical_data'), pd.DataFrame)
+                    and not data['historical_data'].empty
+                    and 'Close' in data['historical_data'].columns
+                }
                 
-                if not hist_data:  # Check if dictionary is empty
-                    st.warning("Could not fetch historical data for visualization.")
-                    return
-
-                tab1, tab2, tab3 = st.tabs(["📈 Historical Performance", "📊 Expected Returns", "🔮 Future Projections"])
-
-                with tab1:
-                    st.markdown("##### Historical Growth Analysis")
-                    st.markdown("This chart shows how your selected investments have performed historically.")
-
-                    # Create historical performance visualization
-                    performance_data = []
-                    dates = None
-                    initial_investment = 10000  # ₹10,000 base investment
+                if closes:
+                    # Align on date and normalize every ticker in a single vectorized step
+                    signatures = tuple((ticker, _history_signature(hist_data[ticker]['historical_data']))
+                                       for ticker in closes)
+                    fig = _performance_figure(signatures, closes, initial_investment)
+                    st.plotly_chart(fig, use_container_width=True)
+
+                    # Add future projection controls
+                    _render_analysis_calculator(user_inputs.get('investment_amount', 5000))
                     
-                    for ticker, data in hist_data.items():
-                        if 'historical_data' in data and isinstance(data['historical_data'], pd.DataFrame):
-                            hist_df = data['historical_data']
-                            if not hist_df.empty and 'Close' in hist_df.columns:
-                                # Store first date series we find
-                                if dates is None:
-                                    dates = hist_df['Date']
-                                # Calculate normalized performance
-                                normalized = (hist_df['Close'] / hist_df['Close'].iloc[0]) * initial_investment
-                                performance_data.append({
-                                    'ticker': ticker,
-                                    'values': normalized
-                                })
-                    
-                    if performance_data and dates is not None:
-                        # Create DataFrame for visualization
-                        df = pd.DataFrame({
-                            data['ticker']: data['values'] for data in performance_data
-                        }, index=dates)
-                        
-                        fig = px.line(
-                            df,
-                            title='Historical Performance of ₹10,000 Investment',
-                            labels={'value': 'Portfolio Value (₹)', 'variable': 'Investment'},
-                        )
-                        fig.update_layout(
-                            showlegend=True,
-                            yaxis_title='Value (₹)',
-                            xaxis_title='Date',
-                            hovermode='x unified'
-                        )
-                        st.plotly_chart(fig, use_container_width=True)
-
-                        # Add future projection controls
-                        st.markdown("##### Investment Projection Calculator")
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            monthly_investment = st.number_input(
-                                "Monthly Investment (₹)",
-                                min_value=1000,
-                                max_value=1000000,
-                                value=user_inputs.get('investment_amount', 5000),
-                                step=1000
-                            )
-                        with col2:
-                            projection_years = st.selectbox(
-                                "Projection Period",
-                                options=[1, 3, 5, 10, 15, 20],
-                                index=2  # Default to 5 years
-                            )
-
-                        # Calculate and show projections
-                        conservative_rate = 0.08  # 8% annual return
-                        moderate_rate = 0.12     # 12% annual return
-                        aggressive_rate = 0.15    # 15% annual return
-
-                        def calculate_future_value(monthly_amount, rate, years):
-                            # Using future value of annuity formula
-                            monthly_rate = rate / 12
-                            n_months = years * 12
-                            fv = monthly_amount * ((1 + monthly_rate) ** n_months - 1) / monthly_rate
-                            return fv
-
-                        conservative_fv = calculate_future_value(monthly_investment, conservative_rate, projection_years)
-                        moderate_fv = calculate_future_value(monthly_investment, moderate_rate, projection_years)
-                        aggressive_fv = calculate_future_value(monthly_investment, aggressive_rate, projection_years)
-
-                        # Create projection visualization
-                        months = range(0, projection_years * 12 + 1)
-                        projections = pd.DataFrame({
-                            'Month': months,
-                            'Conservative': [monthly_investment * i * (1 + conservative_rate/12)**i for i in months],
-                            'Moderate': [monthly_investment * i * (1 + moderate_rate/12)**i for i in months],
-                            'Aggressive': [monthly_investment * i * (1 + aggressive_rate/12)**i for i in months]
-                        })
-                        
-                        # Melt the dataframe for plotting
-                        proj_melted = projections.melt(
-                            id_vars=['Month'],
-                            value_vars=['Conservative', 'Moderate', 'Aggressive'],
-                            var_name='Scenario',
-                            value_name='Value'
-                        )
-                        
-                        # Create the projection plot
-                        fig_proj = px.line(
-                            proj_melted,
-                            x='Month',
-                            y='Value',
-                            color='Scenario',
-                            title=f'Investment Growth Projection Over {projection_years} Years',
-                            labels={'Value': 'Portfolio Value (₹)', 'Month': 'Months'},
-                            color_discrete_map={
-                                'Conservative': '#2E86C1',  # Blue
-                                'Moderate': '#28B463',      # Green
-                                'Aggressive': '#E74C3C'     # Red
-                            }
-                        )
-                        
-                        # Update layout
-                        fig_proj.update_layout(
-                            hovermode='x unified',
-                            yaxis_title='Portfolio Value (₹)',
-                            xaxis_title='Months',
-                            legend_title='Growth Scenario'
-                        )
-                        
-                        # Format y-axis values to show as currency
-                        fig_proj.update_layout(
-                            yaxis=dict(
-                                tickformat=',.0f',
-                                tickprefix='₹'
-                            )
-                        )
-                        
-                        st.plotly_chart(fig_proj, use_container_width=True)
-                        
-                        # Display final values
-                        st.markdown("#### Projected Final Values")
-                        final_values = st.columns(3)
-                        with final_values[0]:
-                            st.metric(
-                                "Conservative (8% p.a.)",
-                                f"₹{conservative_fv:,.0f}",
-                                f"+₹{(conservative_fv - monthly_investment * 12 * projection_years):,.0f}"
-                            )
-                        with final_values[1]:
-                            st.metric(
-                                "Moderate (12% p.a.)",
-                                f"₹{moderate_fv:,.0f}",
-                                f"+₹{(moderate_fv - monthly_investment * 12 * projection_years):,.0f}"
-                            )
-                        with final_values[2]:
-                            st.metric(
-                                "Aggressive (15% p.a.)",
-                                f"₹{aggressive_fv:,.0f}",
-                                f"+₹{(aggressive_fv - monthly_investment * 12 * projection_years):,.0f}"
-                            )
-                            
-                        # Add investment breakdown
-                        st.markdown("#### Investment Breakdown")
-                        st.info(f"""
-                        💰 Total Investment: ₹{monthly_investment * 12 * projection_years:,.0f}
-                        📈 Potential Returns (Moderate scenario): ₹{(moderate_fv - monthly_investment * 12 * projection_years):,.0f}
-                        🎯 Monthly Investment: ₹{monthly_investment:,.0f}
-                        ⏳ Investment Period: {projection_years} years
-                        """)
-                        
-
-                with tab2:
-                    st.markdown("##### Expected Returns Analysis")
-                    st.markdown("This chart compares the projected annual returns based on historical performance.")
-                    
-                    returns_data = {}
-                    for ticker, data in hist_data.items():
-                        if 'historical_data' in data and isinstance(data['historical_data'], pd.DataFrame):
-                            returns_data[ticker] = calculate_expected_return(data['historical_data'])
+
+            with tab2:
+                st.markdown("##### Expected Returns Analysis")
+                st.markdown("This chart compares the projected annual returns based on historical performance.")
+                
+                # One vectorized pass over every ticker's closes instead of a per-ticker call
+                close_series = {
+                    ticker: data['historical_data'].set_index('Date')['Close']
+                    for ticker, data in hist_data.items()
+                    if isinstance(data.get('historical_data'), pd.DataFrame)
+                }
+                signatures = tuple((ticker, _history_signature(hist_data[ticker]['historical_data']))
+                                   for ticker in close_series)
+                returns_data = _cached_expected_returns(signatures, close_series) if close_series else pd.Series(dtype=float)
+                
+                if not returns_data.empty:
+                    returns_df = (
+                        returns_data.rename("Expected Return")
+                        .rename_axis("Investment")
+                        .reset_index()
+                        .sort_values("Expected Return", ascending=False)
+                    )
                     
-                    if returns_data:
-                        returns_df = pd.DataFrame(list(returns_data.items()), columns=["Investment", "Expected Return"])
-                        returns_df = returns_df.sort_values("Expected Return", ascending=False)
-                        
-                        fig_returns = px.bar(
-                            returns_df,
-                            x="Investment",
-                            y="Expected Return",
-                            color="Expected Return",
-                            title="Projected Annual Returns",
-                            labels={"Expected Return": "Expected Annual Return (%)", "Investment": "Investment Option"},
-                            color_continuous_scale=px.colors.sequential.Tealgrn,
-                            text_auto='.1f'
-                        )
-                        fig_returns.update_traces(
-                            texttemplate='%{y:.1f}%',
-                            textposition='outside'
-                        )
-                        fig_returns.update_layout(
-                            showlegend=False,
-                            yaxis_title='Expected Annual Return (%)',
-                            xaxis_title='Investment Options'
-                        )
-                        st.plotly_chart(fig_returns, use_container_width=True)
+                    fig_returns = _px().bar(
+                        returns_df,
+                        x="Investment",
+                        y="Expected Return",
+                        color="Expected Return",
+                        title="Projected Annual Returns",
+                        labels={"Expected Return": "Expected Annual Return (%)", "Investment": "Investment Option"},
+                        color_continuous_scale=_px().colors.sequential.Tealgrn,
+                        text_auto='.1f'
+                    )
+                    fig_returns.update_traces(
+                        texttemplate='%{y:.1f}%',
+                        textposition='outside'
+                    )
+                    fig_returns.update_layout(
+                        showlegend=False,
+                        yaxis_title='Expected Annual Return (%)',
+                        xaxis_title='Investment Options'
+                    )
+                    st.plotly_chart(fig_returns, use_container_width=True)
 
     except Exception as e:
         st.error(f"An unexpected error occurred: {e}")
@@ -537,9 +670,6 @@ def display_results(user_inputs):
 st.markdown("## 📊 Investment Projection Calculator")
 st.markdown("Plan your investment journey with our interactive calculator")
 
-# Investment calculator inputs
-calc_col1, calc_col2 = st.columns(2)
-
 # Initialize session state for calculator values if not exists
 if 'calc_monthly_investment' not in st.session_state:
     st.session_state.calc_monthly_investment = 5000
@@ -552,123 +682,37 @@ def update_monthly_investment():
 def update_projection_years():
     st.session_state.calc_projection_years = st.session_state.calculator_projection_years
 
-with calc_col1:
-    monthly_investment = st.number_input(
-        "Monthly Investment (₹)",
-        min_value=1000,
-        max_value=1000000,
-        value=st.session_state.calc_monthly_investment,
-        step=1000,
-        key="calculator_monthly_investment",
-        on_change=update_monthly_investment
-    )
-
-with calc_col2:
-    projection_years = st.selectbox(
-        "Investment Time Horizon (Years)",
-        options=[1, 3, 5, 10, 15, 20],
-        index=[1, 3, 5, 10, 15, 20].index(st.session_state.calc_projection_years),
-        key="calculator_projection_years",
-        on_change=update_projection_years
-    )
-
-# Calculate projections if inputs are provided
-if monthly_investment > 0 and projection_years > 0:
-    # Calculate projections
-    conservative_rate = 0.08  # 8% annual return
-    moderate_rate = 0.12     # 12% annual return
-    aggressive_rate = 0.15   # 15% annual return
-
-    def calculate_future_value(monthly_amount, rate, years):
-        monthly_rate = rate / 12
-        n_months = years * 12
-        fv = monthly_amount * ((1 + monthly_rate) ** n_months - 1) / monthly_rate
-        return fv
-
-    conservative_fv = calculate_future_value(monthly_investment, conservative_rate, projection_years)
-    moderate_fv = calculate_future_value(monthly_investment, moderate_rate, projection_years)
-    aggressive_fv = calculate_future_value(monthly_investment, aggressive_rate, projection_years)
-
-    # Create projection visualization
-    months = range(0, projection_years * 12 + 1)
-    projections = pd.DataFrame({
-        'Month': months,
-        'Conservative': [monthly_investment * i * (1 + conservative_rate/12)**i for i in months],
-        'Moderate': [monthly_investment * i * (1 + moderate_rate/12)**i for i in months],
-        'Aggressive': [monthly_investment * i * (1 + aggressive_rate/12)**i for i in months]
-    })
-
-    # Melt the dataframe for plotting
-    proj_melted = projections.melt(
-        id_vars=['Month'],
-        value_vars=['Conservative', 'Moderate', 'Aggressive'],
-        var_name='Scenario',
-        value_name='Value'
-    )
-
-    # Create the projection plot
-    fig_proj = px.line(
-        proj_melted,
-        x='Month',
-        y='Value',
-        color='Scenario',
-        title=f'Investment Growth Projection Over {projection_years} Years',
-        labels={'Value': 'Portfolio Value (₹)', 'Month': 'Months'},
-        color_discrete_map={
-            'Conservative': '#2E86C1',  # Blue
-            'Moderate': '#28B463',      # Green
-            'Aggressive': '#E74C3C'     # Red
-        }
-    )
-
-    # Update layout
-    fig_proj.update_layout(
-        hovermode='x unified',
-        yaxis_title='Portfolio Value (₹)',
-        xaxis_title='Months',
-        legend_title='Growth Scenario'
-    )
-
-    # Format y-axis values to show as currency
-    fig_proj.update_layout(
-        yaxis=dict(
-            tickformat=',.0f',
-            tickprefix='₹'
+# Calculator interactions rerun only this fragment, not the whole page
+@st.fragment
+def render_investment_calculator():
+    # Investment calculator inputs
+    calc_col1, calc_col2 = st.columns(2)
+
+    with calc_col1:
+        monthly_investment = st.number_input(
+            "Monthly Investment (₹)",
+            min_value=1000,
+            max_value=1000000,
+            value=st.session_state.calc_monthly_investment,
+            step=1000,
+            key="calculator_monthly_investment",
+            on_change=update_monthly_investment
         )
-    )
 
-    st.plotly_chart(fig_proj, use_container_width=True)
-
-    # Display final values
-    st.markdown("#### Projected Final Values")
-    final_values = st.columns(3)
-    with final_values[0]:
-        st.metric(
-            "Conservative (8% p.a.)",
-            f"₹{conservative_fv:,.0f}",
-            f"+₹{(conservative_fv - monthly_investment * 12 * projection_years):,.0f}"
-        )
-    with final_values[1]:
-        st.metric(
-            "Moderate (12% p.a.)",
-            f"₹{moderate_fv:,.0f}",
-            f"+₹{(moderate_fv - monthly_investment * 12 * projection_years):,.0f}"
-        )
-    with final_values[2]:
-        st.metric(
-            "Aggressive (15% p.a.)",
-            f"₹{aggressive_fv:,.0f}",
-            f"+₹{(aggressive_fv - monthly_investment * 12 * projection_years):,.0f}"
+    with calc_col2:
+        projection_years = st.selectbox(
+            "Investment Time Horizon (Years)",
+            options=PROJECTION_YEARS,
+            index=PROJECTION_YEARS.index(st.session_state.calc_projection_years),
+            key="calculator_projection_years",
+            on_change=update_projection_years
         )
 
-    # Add investment breakdown
-    st.markdown("#### Investment Breakdown")
-    st.info(f"""
-    💰 Total Investment: ₹{monthly_investment * 12 * projection_years:,.0f}
-    📈 Potential Returns (Moderate scenario): ₹{(moderate_fv - monthly_investment * 12 * projection_years):,.0f}
-    🎯 Monthly Investment: ₹{monthly_investment:,.0f}
-    ⏳ Investment Period: {projection_years} years
-    """)
+    # Calculate projections if inputs are provided
+    if monthly_investment > 0 and projection_years > 0:
+        render_projection_calculator(monthly_investment, projection_years, key_prefix="calculator")
+
+render_investment_calculator()
 
 # --- Main Content Area for Personalized Advice ---
 st.markdown("---")
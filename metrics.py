@@ -0,0 +1,111 @@
+import numpy as np
+from typing import Tuple
+
+# numba is optional; without it the metrics fall back to NumPy reductions
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+TRADING_DAYS_PER_YEAR = 252
+MIN_RETURN_OBSERVATIONS = 30
+
+
+def _ohlcv_metrics_loop(high, low, close, volume):
+    """Single pass over the OHLCV arrays, skipping NaNs like pandas does"""
+    high_max = np.nan
+    low_min = np.nan
+    vol_sum = 0.0
+    vol_count = 0
+    first_close = np.nan
+    last_close = np.nan
+    close_count = 0
+
+    for i in range(close.shape[0]):
+        h = high[i]
+        if h == h and not high_max >= h:  # NaN-safe max
+            high_max = h
+        lo = low[i]
+        if lo == lo and not low_min <= lo:  # NaN-safe min
+            low_min = lo
+        v = volume[i]
+        if v == v:
+            vol_sum += v
+            vol_count += 1
+        c = close[i]
+        if c == c:
+            if close_count == 0:
+                first_close = c
+            last_close = c
+            close_count += 1
+
+    avg_volume = vol_sum / vol_count if vol_count > 0 else np.nan
+    return high_max, low_min, avg_volume, first_close, last_close, close_count
+
+
+def _ohlcv_metrics_numpy(high, low, close, volume):
+    """Vectorized equivalent of `_ohlcv_metrics_loop`"""
+    valid_close = close[~np.isnan(close)]
+    if valid_close.size == 0:
+        first_close = last_close = np.nan
+    else:
+        first_close, last_close = valid_close[0], valid_close[-1]
+    # Guard all-NaN inputs, which make the nan-reductions warn
+    high_max = np.nanmax(high) if not np.isnan(high).all() else np.nan
+    low_min = np.nanmin(low) if not np.isnan(low).all() else np.nan
+    avg_volume = np.nanmean(volume) if not np.isnan(volume).all() else np.nan
+    return high_max, low_min, avg_volume, first_close, last_close, valid_close.size
+
+
+_kernel = njit(cache=True)(_ohlcv_metrics_loop) if njit is not None else _ohlcv_metrics_numpy
+
+
+def ohlcv_metrics(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                  volume: np.ndarray) -> Tuple[float, float, float, float, float, int]:
+    """
+    Computes the summary metrics for a price history in one pass.
+
+    Args:
+        high, low, close, volume: 1-D float64 arrays of equal length
+
+    Returns:
+        (max high, min low, mean volume, first close, last close, number of closes),
+        ignoring NaN entries
+    """
+    high_max, low_min, avg_volume, first_close, last_close, close_count = _kernel(
+        high, low, close, volume
+    )
+    return (float(high_max), float(low_min), float(avg_volume),
+            float(first_close), float(last_close), int(close_count))
+
+
+def annualized_log_return(first_close: float, last_close: float, n_prices: int) -> float:
+    """
+    Annualizes the mean daily log return between two closes as a percentage.
+
+    The mean of the daily log returns telescopes to
+    (log(last) - log(first)) / (n_prices - 1), so only the endpoints are needed.
+    Returns 0.0 when there are too few observations, and clamps to [-100, 100].
+    """
+    if n_prices - 1 < MIN_RETURN_OBSERVATIONS:
+        return 0.0
+    mu_daily = (np.log(last_close) - np.log(first_close)) / (n_prices - 1)
+    annual_return = (np.exp(mu_daily * TRADING_DAYS_PER_YEAR) - 1) * 100
+    return float(np.clip(annual_return, -100.0, 100.0))
+
+
+def annualized_log_returns(first_close: np.ndarray, last_close: np.ndarray,
+                           n_prices: np.ndarray) -> np.ndarray:
+    """
+    Vectorized `annualized_log_return` over arrays of endpoints and close counts.
+
+    Entries with too few observations are 0.0, matching the scalar version.
+    """
+    first_close = np.asarray(first_close, dtype=np.float64)
+    last_close = np.asarray(last_close, dtype=np.float64)
+    n_intervals = np.asarray(n_prices, dtype=np.float64) - 1
+    enough = n_intervals >= MIN_RETURN_OBSERVATIONS
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mu_daily = (np.log(last_close) - np.log(first_close)) / n_intervals
+        annual_return = (np.exp(mu_daily * TRADING_DAYS_PER_YEAR) - 1) * 100
+    return np.where(enough, np.clip(annual_return, -100.0, 100.0), 0.0)
@@ -1,9 +1,108 @@
 import os
+import re
+import time
+from itertools import islice
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from functools import lru_cache
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
-load_dotenv()
+# orjson is optional; without it responses are decoded with requests' stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+@lru_cache(maxsize=1)
+def _load_env():
+    """Reads .env the first time news is requested rather than at import"""
+    load_dotenv()
+
+@lru_cache(maxsize=1)
+def _get_session():
+    """
+    Shared session so repeated news requests reuse the pooled TLS connection.
+    Built on first use, so importing this module doesn't pay for it.
+    """
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(
+        pool_connections=4, pool_maxsize=10,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    ))
+    return session
+
+_NEWS_TIMEOUT = (3.05, 10)  # (connect, read) seconds, so a stalled API can't hang the page
+
+# Headlines only change every few minutes, so reuse a successful fetch for a while
+_NEWS_TTL = 15 * 60  # 15 minutes
+_NEWS_CACHE = {}  # query -> (fetched_at, articles, etag)
+
+# Fallback news data in case the API fails; dated today whenever it is served
+_FALLBACK_NEWS = (
+    {
+        "title": "Indian Stock Market Reaches New Heights",
+        "description": "The Indian stock market continues its bullish trend with Sensex and Nifty touching new records. Strong domestic economic indicators and global market stability contributing to the growth.",
+        "source": "Market Analysis",
+        "url": "https://www.moneycontrol.com"
+    },
+    {
+        "title": "Tech Stocks Lead Global Market Rally",
+        "description": "Technology sector stocks show strong performance globally. AI and cloud computing companies leading the charge with substantial gains.",
+        "source": "Financial Times",
+        "url": "https://www.ft.com"
+    },
+    {
+        "title": "RBI Maintains Policy Stance",
+        "description": "Reserve Bank of India keeps key rates unchanged in its latest monetary policy meeting. Inflation control remains priority while supporting growth.",
+        "source": "Economic Times",
+        "url": "https://economictimes.indiatimes.com"
+    },
+    {
+        "title": "Cryptocurrency Market Shows Recovery",
+        "description": "Bitcoin and other major cryptocurrencies demonstrate strong recovery signals. Institutional adoption continues to grow despite regulatory challenges.",
+        "source": "Crypto News",
+        "url": "https://www.coindesk.com"
+    },
+    {
+        "title": "Oil Prices Impact Global Markets",
+        "description": "Fluctuations in global oil prices creating market volatility. Energy sector stocks showing mixed responses to the changing dynamics.",
+        "source": "Reuters",
+        "url": "https://www.reuters.com"
+    }
+)
+
+def _fallback_news():
+    """Fresh copies of the fallback articles, published today"""
+    today = datetime.now().strftime("%Y-%m-%d")
+    return [{**article, "published": today} for article in _FALLBACK_NEWS]
+
+def _clean_article_stream(articles):
+    """Yields cleaned NewsAPI articles, skipping incomplete ones and repeated titles"""
+    seen_titles = set()  # To avoid duplicates, ignoring case
+    for article in articles:
+        # NewsAPI sends null for missing fields, so guard against None as well
+        title = (article.get("title") or "").strip()
+        desc = (article.get("description") or "").strip()
+        
+        # Skip articles without title or description
+        if not title or not desc:
+            continue
+            
+        # Skip duplicates
+        title_key = title.casefold()
+        if title_key in seen_titles:
+            continue
+        seen_titles.add(title_key)
+        
+        yield {
+            "title": title,
+            "description": desc,
+            "url": article.get("url") or "",
+            "source": (article.get("source") or {}).get("name") or "Unknown",
+            "published": article.get("publishedAt") or ""
+        }
 
 def get_financial_news(query="finance"):
     """
@@ -16,49 +115,15 @@ def get_financial_news(query="finance"):
     Returns:
         list: A list of dictionaries, where each dictionary is a news article.
     """
-    # Fallback news data in case API fails
-    fallback_news = [
-        {
-            "title": "Indian Stock Market Reaches New Heights",
-            "description": "The Indian stock market continues its bullish trend with Sensex and Nifty touching new records. Strong domestic economic indicators and global market stability contributing to the growth.",
-            "source": "Market Analysis",
-            "published": datetime.now().strftime("%Y-%m-%d"),
-            "url": "https://www.moneycontrol.com"
-        },
-        {
-            "title": "Tech Stocks Lead Global Market Rally",
-            "description": "Technology sector stocks show strong performance globally. AI and cloud computing companies leading the charge with substantial gains.",
-            "source": "Financial Times",
-            "published": datetime.now().strftime("%Y-%m-%d"),
-            "url": "https://www.ft.com"
-        },
-        {
-            "title": "RBI Maintains Policy Stance",
-            "description": "Reserve Bank of India keeps key rates unchanged in its latest monetary policy meeting. Inflation control remains priority while supporting growth.",
-            "source": "Economic Times",
-            "published": datetime.now().strftime("%Y-%m-%d"),
-            "url": "https://economictimes.indiatimes.com"
-        },
-        {
-            "title": "Cryptocurrency Market Shows Recovery",
-            "description": "Bitcoin and other major cryptocurrencies demonstrate strong recovery signals. Institutional adoption continues to grow despite regulatory challenges.",
-            "source": "Crypto News",
-            "published": datetime.now().strftime("%Y-%m-%d"),
-            "url": "https://www.coindesk.com"
-        },
-        {
-            "title": "Oil Prices Impact Global Markets",
-            "description": "Fluctuations in global oil prices creating market volatility. Energy sector stocks showing mixed responses to the changing dynamics.",
-            "source": "Reuters",
-            "published": datetime.now().strftime("%Y-%m-%d"),
-            "url": "https://www.reuters.com"
-        }
-    ]
+    entry = _NEWS_CACHE.get(query)
+    if entry and time.time() - entry[0] < _NEWS_TTL:
+        return list(entry[1])
 
+    _load_env()
     api_key = os.getenv("NEWSAPI_KEY")
     if not api_key:
         print("NEWSAPI_KEY not found in .env file, using fallback news.")
-        return fallback_news
+        return _fallback_news()
 
     # Use everything endpoint for broader search
     url = "https://newsapi.org/v2/everything"
@@ -77,10 +142,17 @@ def get_financial_news(query="finance"):
         'pageSize': 10  # Request 10 articles to ensure we get enough good ones
     }
 
+    # Revalidate an expired entry: if the server still has the same articles it answers
+    # 304 with no body, and the cached copy is reused
+    headers = {'If-None-Match': entry[2]} if entry and entry[2] else None
+
     try:
-        response = requests.get(url, params=params)
+        response = _get_session().get(url, params=params, headers=headers, timeout=_NEWS_TIMEOUT)
+        if response.status_code == 304:
+            _NEWS_CACHE[query] = (time.time(), entry[1], entry[2])
+            return list(entry[1])
         response.raise_for_status()  # Raise an exception for bad status codes
-        data = response.json()
+        data = orjson.loads(response.content) if orjson is not None else response.json()
         
         if data.get('status') != 'ok':
             print(f"NewsAPI Error: {data.get('message', 'Unknown error')}")
@@ -88,36 +160,10 @@ def get_financial_news(query="finance"):
             
         articles = data.get("articles", [])
         
-        # Filter and clean articles
-        top_articles = []
-        seen_titles = set()  # To avoid duplicates
-        
-        for article in articles:
-            title = article.get("title", "").strip()
-            desc = article.get("description", "").strip()
-            
-            # Skip articles without title or description
-            if not title or not desc:
-                continue
-                
-            # Skip duplicates
-            if title in seen_titles:
-                continue
-                
-            seen_titles.add(title)
-            
-            top_articles.append({
-                "title": title,
-                "description": desc,
-                "url": article.get("url", ""),
-                "source": article.get("source", {}).get("name", "Unknown"),
-                "published": article.get("publishedAt", "")
-            })
-            
-            # Stop after getting 5 good articles
-            if len(top_articles) >= 5:
-                break
+        # Filter and clean articles, stopping after 5 good ones
+        top_articles = list(islice(_clean_article_stream(articles), 5))
                 
+        _NEWS_CACHE[query] = (time.time(), tuple(top_articles), response.headers.get('ETag'))
         return top_articles
 
     except requests.exceptions.RequestException as e:
@@ -127,22 +173,24 @@ def get_financial_news(query="finance"):
         print(f"An unexpected error occurred in get_financial_news: {e}")
         return {"error": f"An unexpected error occurred: {e}"}
 
+# Common financial terms to look for, matched anywhere in a sentence ("markets" counts)
+_KEY_TERMS = (
+    'market', 'stock', 'index', 'growth', 'decline', 'percent', 'rate',
+    'economy', 'inflation', 'recession', 'investors', 'trading', 'price',
+    'earnings', 'forecast', 'outlook', 'analysis'
+)
+_KEY_TERMS_RE = re.compile('|'.join(map(re.escape, _KEY_TERMS)), re.IGNORECASE)
+
+# Words that make any number in the article worth quoting as a metric
+_DIRECTION_TERMS = ('up', 'down', 'rose', 'fell', 'increased', 'decreased')
+# Whitespace-separated words containing at least one digit
+_NUMBER_WORD_RE = re.compile(r'\S*\d\S*')
+
 def extract_key_points(text):
     """Helper function to extract key financial points from text"""
-    # Common financial terms to look for
-    key_terms = [
-        'market', 'stock', 'index', 'growth', 'decline', 'percent', 'rate',
-        'economy', 'inflation', 'recession', 'investors', 'trading', 'price',
-        'earnings', 'forecast', 'outlook', 'analysis'
-    ]
-    
     # Split into sentences and look for ones with key terms
     sentences = [s.strip() for s in text.split('.') if s.strip()]
-    key_sentences = []
-    
-    for sentence in sentences:
-        if any(term in sentence.lower() for term in key_terms):
-            key_sentences.append(sentence)
+    key_sentences = [sentence for sentence in sentences if _KEY_TERMS_RE.search(sentence)]
     
     return '. '.join(key_sentences)
 
@@ -154,34 +202,49 @@ def summarize_news_for_llm(articles):
     if not articles or "error" in articles:
         return "No financial news could be retrieved at this time."
 
-    summary = []
-    summary.append("Current Market Context and News Analysis:\n")
-    
-    for i, article in enumerate(articles, 1):
+    # The summary is a pure function of these fields, so memoize on them
+    articles_key = tuple(
+        (article['title'], article.get('description', ''), article['source'], article.get('published', ''))
+        for article in articles
+    )
+    return _summarize_articles(articles_key)
+
+def _iter_insight_lines(articles_key):
+    """Yields the summary lines for each article that has key financial points"""
+    for i, (title, desc, source, published) in enumerate(articles_key, 1):
         # Get all possible content
-        title = article['title'].strip()
-        desc = article.get('description', '').strip()
-        source = article['source']
-        date = article.get('published', '').split('T')[0]  # Just the date part
+        title = title.strip()
+        desc = desc.strip()
+        date = published.split('T')[0]  # Just the date part
         
         # Extract key points from both title and description
         content = f"{title}. {desc}"
         key_points = extract_key_points(content)
+        if not key_points:
+            continue
         
-        if key_points:
-            summary.append(f"{i}. Key Market Insight ({source}, {date}):")
-            summary.append(f"   {key_points}")
-            
-            # Add any numerical data or percentages if found
-            numbers = [word for word in content.split() if any(c.isdigit() for c in word)]
-            if numbers:
-                relevant_numbers = [n for n in numbers if '%' in n or '$' in n or any(term in content.lower() for term in ['up', 'down', 'rose', 'fell', 'increased', 'decreased'])]
-                if relevant_numbers:
-                    summary.append(f"   Relevant Metrics: {', '.join(relevant_numbers)}")
-            
-            summary.append("")  # Empty line for readability
-    
-    if len(summary) <= 2:  # Only has the header
+        yield f"{i}. Key Market Insight ({source}, {date}):"
+        yield f"   {key_points}"
+        
+        # Add any numerical data or percentages if found
+        numbers = _NUMBER_WORD_RE.findall(content)
+        if numbers:
+            content_lower = content.lower()
+            if any(term in content_lower for term in _DIRECTION_TERMS):
+                relevant_numbers = numbers
+            else:
+                relevant_numbers = [n for n in numbers if '%' in n or '$' in n]
+            if relevant_numbers:
+                yield f"   Relevant Metrics: {', '.join(relevant_numbers)}"
+        
+        yield ""  # Empty line for readability
+
+@lru_cache(maxsize=32)
+def _summarize_articles(articles_key):
+    """Builds the LLM news summary from (title, description, source, published) tuples"""
+    insight_lines = _iter_insight_lines(articles_key)
+    first_line = next(insight_lines, None)
+    if first_line is None:  # Only the header would be left
         return "No substantial financial insights could be extracted from the news at this time."
         
-    return "\n".join(summary)
+    return "\n".join(("Current Market Context and News Analysis:\n", first_line, *insight_lines))